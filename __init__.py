@@ -10,12 +10,23 @@ bl_info = {
 
 import bpy
 import importlib
+import json
+import os
 import pkgutil
 import sys
 import traceback
 from pathlib import Path
 
-_loaded_modules = []
+# True when Blender re-imports this package (F8 Reload Scripts, or re-enabling after installing
+# a new zip): the submodules in sys.modules are then stale and get reloaded once
+_PACKAGE_RELOADED = "_loaded_modules" in locals()
+
+_loaded_modules = {}
+_discovered_modules = None
+_reloaded_modules = set()
+
+# Set EDM_TOOLS_DEV=1 to reload module code on every register() while developing
+_DEV_MODE = os.environ.get("EDM_TOOLS_DEV") == "1"
 
 
 # ------------------------------------------------------------
@@ -30,6 +41,8 @@ class EDMTOOLS_PT_root(bpy.types.Panel):
 
     def draw(self, context):
         layout = self.layout
+        if _DEV_MODE:
+            layout.operator("edmtools.rescan_modules", icon='FILE_REFRESH')
 
 
 # ------------------------------------------------------------
@@ -44,31 +57,93 @@ def _discover_modules():
         print("[EDM Tools]: No 'modules' folder found.")
         return found
 
-    for file in package_path.glob("*.py"):
-        if file.name == "__init__.py":
+    for info in pkgutil.iter_modules([str(package_path)]):
+        if info.ispkg:
             continue
-        modname = f".modules.{file.stem}"
+        modname = f".modules.{info.name}"
         found.append(modname)
     return found
 
 
-def _import_modules():
-    """Import or reload all discovered modules, with verbose error logging."""
-    global _loaded_modules
-    _loaded_modules.clear()
-
-    discovered = _discover_modules()
+def _discover_modules_cached():
+    """Read module names from modules/_manifest.json (written by the release build),
+    falling back to scanning the folder when it's missing.
+
+    The result is kept for later register() calls in the session (except in developer mode).
+    """
+    global _discovered_modules
+    if _discovered_modules is not None and not _DEV_MODE:
+        return _discovered_modules
+
+    manifest = Path(__file__).parent / "modules" / "_manifest.json"
+    try:
+        with open(manifest, encoding="utf8") as f:
+            stems = json.load(f)
+        _discovered_modules = tuple(f".modules.{stem}" for stem in stems)
+    except FileNotFoundError:
+        _discovered_modules = tuple(_discover_modules())
+    except Exception as e:
+        print(f"[EDM Tools]: Ignoring unreadable module manifest: {e}")
+        _discovered_modules = tuple(_discover_modules())
+    return _discovered_modules
+
+
+def _import_one(path):
+    """Import a module (reloading it in developer mode, or once after the package itself was reloaded)."""
+    mod = sys.modules.get(f"{__package__}{path}")
+    if mod is None:
+        return importlib.import_module(path, __package__)
+    if _DEV_MODE or (_PACKAGE_RELOADED and path not in _reloaded_modules):
+        _reloaded_modules.add(path)
+        mod = importlib.reload(mod)
+    return mod
+
+
+def _import_modules(only_new=False):
+    """Import all discovered modules that aren't loaded yet, with verbose error logging.
+    Returns the modules imported by this call."""
+    discovered = _discover_modules_cached()
     print(f"[EDM Tools]: Found {len(discovered)} module(s): {discovered}")
 
+    imported = []
     for path in discovered:
+        if path in _loaded_modules and (only_new or not _DEV_MODE):
+            continue
         try:
-            mod = importlib.import_module(path, __package__)
-            mod = importlib.reload(mod)
-            _loaded_modules.append(mod)
+            _loaded_modules[path] = _import_one(path)
+            imported.append(_loaded_modules[path])
             print(f"[EDM Tools]: Loaded: {path}")
         except Exception as e:
             print(f"[EDM Tools]: Failed to load module '{path}': {e}")
             traceback.print_exc()
+    return imported
+
+
+def _register_module(mod):
+    if hasattr(mod, "register"):
+        try:
+            mod.register()
+            print(f"[EDM Tools]: Registered module: {mod.__name__}")
+        except Exception as e:
+            print(f"[EDM Tools]: Error registering {mod.__name__}: {e}")
+            traceback.print_exc()
+
+
+class EDMTOOLS_OT_rescan_modules(bpy.types.Operator):
+    """Scan the modules folder again and register any modules added since startup"""
+    bl_idname = "edmtools.rescan_modules"
+    bl_label = "Rescan Modules"
+
+    def execute(self, context):
+        global _discovered_modules
+        _discovered_modules = tuple(_discover_modules())
+
+        added = _import_modules(only_new=True)
+        for mod in added:
+            _register_module(mod)
+
+        self.report({'INFO'}, f"Registered {len(added)} new module(s)")
+        return {'FINISHED'}
 
 
 # ------------------------------------------------------------
@@ -77,6 +152,7 @@ def _import_modules():
 
 classes = (
     EDMTOOLS_PT_root,
+    EDMTOOLS_OT_rescan_modules,
 )
 
 
@@ -87,21 +163,15 @@ def register():
 
     _import_modules()
 
-    for mod in _loaded_modules:
-        if hasattr(mod, "register"):
-            try:
-                mod.register()
-                print(f"[EDM Tools]: Registered module: {mod.__name__}")
-            except Exception as e:
-                print(f"[EDM Tools]: Error registering {mod.__name__}: {e}")
-                traceback.print_exc()
+    for mod in _loaded_modules.values():
+        _register_module(mod)
 
     print("[EDM Tools]: Initialization complete.\n")
 
 
 def unregister():
     print("\n[EDM Tools]: Unregistering EDM Tools modules...\n")
-    for mod in reversed(_loaded_modules):
+    for mod in reversed(list(_loaded_modules.values())):
         if hasattr(mod, "unregister"):
             try:
                 mod.unregister()
@@ -113,6 +183,8 @@ def unregister():
     for c in reversed(classes):
         bpy.utils.unregister_class(c)
 
+    # Keep _discovered_modules: the modules stay in sys.modules and are simply
+    # registered again on the next register()
     _loaded_modules.clear()
     print("[EDM Tools]: Unregistration complete.\n")
 
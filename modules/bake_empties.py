@@ -2,7 +2,61 @@
 # EDM Tools – Bake Empties from Armature (modular subpanel)
 
 import bpy
-from bpy.props import BoolProperty, IntProperty, StringProperty, EnumProperty, PointerProperty, FloatProperty
+import numpy as np
+from array import array
+from bpy.props import BoolProperty, IntProperty, IntVectorProperty, StringProperty, EnumProperty, PointerProperty, FloatProperty
+from mathutils import Euler, Matrix, Quaternion
+
+# Transform channels keyed on every baked empty: (data_path, array length)
+_KEYED_CHANNELS = (("location", 3), ("rotation_quaternion", 4), ("scale", 3))
+_KEYED_VALUES = sum(n for _, n in _KEYED_CHANNELS)  # floats sampled per empty per frame
+
+# Constraint types with a target object + subtarget bone, i.e. the ones retargeted between
+# bones and empties (Armature constraints keep a targets list instead and are left alone)
+_TARGETING_CONSTRAINTS = frozenset({
+    'COPY_LOCATION', 'COPY_ROTATION', 'COPY_SCALE', 'COPY_TRANSFORMS',
+    'DAMPED_TRACK', 'TRACK_TO', 'LOCKED_TRACK', 'STRETCH_TO',
+    'CHILD_OF', 'IK', 'TRANSFORM', 'LIMIT_DISTANCE', 'ACTION', 'PIVOT', 'FLOOR',
+})
+
+# Armature custom property listing the names of its baked empties
+_BAKED_EMPTIES_PROP = "edm_baked_empties"
+# Empty custom property pointing at the armature it was baked from. The mapping above is copied
+# along when the armature is duplicated, so entries only count if their empty points back here.
+_BAKED_OWNER_PROP = "_edm_baked_armature"
+
+def _refresh_active_arm_label(scene, view_layer):
+    """Store the active armature's name for the panel, so draw() doesn't have to look it up."""
+    props = getattr(scene, "edm_tools_bake", None)
+    if props is None or view_layer is None:
+        return
+    obj = view_layer.objects.active
+    label = obj.name if (obj and obj.type == 'ARMATURE') else "None"
+    # Only write on change: the write itself triggers another depsgraph update
+    if props.active_arm_label != label:
+        props.active_arm_label = label
+
+
+@bpy.app.handlers.persistent
+def _on_depsgraph_update(scene, depsgraph):
+    # Selection/active changes tag the scene and renames tag the object; anything else
+    # (material, image, node edits...) can't change the label
+    if depsgraph.id_type_updated('SCENE') or depsgraph.id_type_updated('OBJECT'):
+        _refresh_active_arm_label(scene, depsgraph.view_layer)
+
+
+@bpy.app.handlers.persistent
+def _on_data_replaced(*_args):
+    # Loading a file or undo/redo can change the active object without a depsgraph update
+    _refresh_active_arm_label(bpy.context.scene, bpy.context.view_layer)
+
+
+_LABEL_HANDLERS = (
+    (bpy.app.handlers.depsgraph_update_post, _on_depsgraph_update),
+    (bpy.app.handlers.load_post, _on_data_replaced),
+    (bpy.app.handlers.undo_post, _on_data_replaced),
+    (bpy.app.handlers.redo_post, _on_data_replaced),
+)
 
 # ---------------- Helpers ----------------
 
@@ -12,28 +66,84 @@ def get_active_armature(context):
 
 def empty_name_for(arm_obj, bone_name): return f"CTRL_{arm_obj.name}_{bone_name}"
 
-def ensure_only_in_collection(obj, target_coll):
+def controls_collection_name(arm_obj): return f"EDM_ArmatureCtrls_{arm_obj.name}"
+
+def ensure_only_in_collection(obj, target_coll, in_coll=None):
+    """in_coll: optional set of object names already linked to target_coll, used to skip
+    the users_collection scan when obj is already only in there."""
+    if in_coll is not None and obj.name in in_coll and obj.users == 1:
+        return
     for c in list(obj.users_collection):
         if c != target_coll:
             c.objects.unlink(obj)
     if obj.name not in target_coll.objects:
         target_coll.objects.link(obj)
+    if in_coll is not None:
+        in_coll.add(obj.name)
+
+def stored_baked_empties(context, arm_obj):
+    """{empty: bone name} for the armature's baked empties still in the scene, from the
+    mapping stored on it at bake time ({} if it has none). The bone names are stored too,
+    so renaming the armature or an empty afterwards doesn't lose them."""
+    stored = arm_obj.get(_BAKED_EMPTIES_PROP)
+    if not hasattr(stored, "items"):
+        return {}
+    objects = context.scene.objects
+    found = {}
+    for name, bone in stored.items():
+        o = objects.get(name)
+        if o is not None and o.type == 'EMPTY' and o.get(_BAKED_OWNER_PROP) == arm_obj:
+            found[o] = bone
+    return found
+
+def find_baked_empties(context, arm_obj):
+    """{empty: bone name} for the armature's baked empties ({} if there are none).
+    Uses the mapping stored at bake time; without it tries the controls collection,
+    and only scans the scene as a last resort."""
+    found = stored_baked_empties(context, arm_obj)
+    if found:
+        return found
+    prefix = empty_name_for(arm_obj, "")
+    coll = bpy.data.collections.get(controls_collection_name(arm_obj))
+    empties = []
+    if coll:
+        empties = [o for o in coll.all_objects if o.type == 'EMPTY' and o.name.startswith(prefix)]
+    if not empties:
+        empties = [o for o in context.scene.objects if o.type == 'EMPTY' and o.name.startswith(prefix)]
+    return {e: bone_name_from_empty_name(arm_obj, e) for e in empties}
 
-def get_or_create_empty_for_bone(context, arm_obj, pbone, coll=None):
+def get_or_create_empty_for_bone(context, arm_obj, pbone, coll=None, existing=None, in_coll=None):
+    """existing: optional {name: object} snapshot of the armature's control empties, so
+    repeated calls don't each search the scene. Names missing from it are still looked up
+    in the scene, so an empty the snapshot doesn't know about isn't duplicated."""
     name = empty_name_for(arm_obj, pbone.name)
-    existing = context.scene.objects.get(name)
-    if existing:
-        if coll: ensure_only_in_collection(existing, coll)
-        return existing
+    found = existing.get(name) if existing is not None else None
+    if found is None:
+        found = context.scene.objects.get(name)
+    if found:
+        if coll: ensure_only_in_collection(found, coll, in_coll)
+        return found
     empty = bpy.data.objects.new(name, None)
     # position at bone-head world
     empty.matrix_world.translation = (arm_obj.matrix_world @ pbone.head)
-    if coll: coll.objects.link(empty)
+    if coll:
+        coll.objects.link(empty)
+        if in_coll is not None: in_coll.add(empty.name)
     else: context.scene.collection.objects.link(empty)
     return empty
 
-def bone_is_visible(arm_obj, pbone):
-    """Cross-version bone visibility check for Blender 4.x and older."""
+def visible_bone_collections(arm_obj):
+    """Names of the armature's visible bone collections, or None on Blender < 4.0 (no collections)."""
+    arm = arm_obj.data
+    colls = getattr(arm, "collections_all", None) or getattr(arm, "collections", None)
+    if colls is None:
+        return None
+    return frozenset(c.name for c in colls if getattr(c, "is_visible_effectively", c.is_visible))
+
+def bone_is_visible(arm_obj, pbone, check_armature=True, visible_colls=None):
+    """Cross-version bone visibility check for Blender 4.x and older.
+    Pass check_armature=False if the armature's own visibility was already checked,
+    and visible_colls from visible_bone_collections() to also honour hidden bone collections."""
     bone = pbone.bone
 
     # Bone hidden?
@@ -42,24 +152,36 @@ def bone_is_visible(arm_obj, pbone):
     if getattr(bone, "hide_viewport", False):
         return False
 
+    # All of the bone's collections hidden? (bones in no collection are always shown)
+    if visible_colls is not None:
+        colls = bone.collections
+        if len(colls) and not any(c.name in visible_colls for c in colls):
+            return False
+
     # Armature hidden?
-    if getattr(arm_obj, "hide_viewport", False):
+    if check_armature and getattr(arm_obj, "hide_viewport", False):
         return False
 
     return True
 
 
 def filter_pose_bones(context, arm_obj, props):
-    pbs = list(arm_obj.pose.bones)
-    if props.which_bones == 'SELECTED' or props.only_selected_bones:
-        bones = [pb for pb in pbs if pb.bone.select]
-    elif props.which_bones == 'VISIBLE':
-        bones = [pb for pb in pbs if bone_is_visible(arm_obj, pb)]
-    else:
-        bones = pbs
-    if props.only_deform:
-        bones = [pb for pb in bones if pb.bone.use_deform]
-    return bones
+    # Read the filter settings once, then do a single pass over the bones
+    sel_mode = props.which_bones == 'SELECTED' or props.only_selected_bones
+    vis_mode = props.which_bones == 'VISIBLE' and not sel_mode
+    only_deform = props.only_deform
+
+    # Armature and bone collection visibility are the same for every bone
+    if vis_mode and getattr(arm_obj, "hide_viewport", False):
+        return []
+    visible_colls = visible_bone_collections(arm_obj) if vis_mode else None
+
+    return [
+        pb for pb in arm_obj.pose.bones
+        if (not sel_mode or pb.bone.select)
+        and (not vis_mode or bone_is_visible(arm_obj, pb, False, visible_colls))
+        and (not only_deform or pb.bone.use_deform)
+    ]
 
 def make_controls_collection_for_armature(context, arm_obj):
     # Choose a "base" collection: wherever the armature lives
@@ -68,20 +190,206 @@ def make_controls_collection_for_armature(context, arm_obj):
     else:
         base_coll = context.scene.collection
 
-    coll_name = f"EDM_ArmatureCtrls_{arm_obj.name}"
+    coll_name = controls_collection_name(arm_obj)
+
+    # Usual case: already linked under the base collection (name lookup, no list scan)
+    coll = base_coll.children.get(coll_name)
+    if coll is not None:
+        return coll
 
     coll = bpy.data.collections.get(coll_name)
     if coll is None:
         coll = bpy.data.collections.new(coll_name)
-        base_coll.children.link(coll)
-    else:
-        # Ensure it's at least linked under the same base collection
-        if coll not in base_coll.children:
-            base_coll.children.link(coll)
+    base_coll.children.link(coll)
 
     return coll
 
 
+def parent_space_matrix(obj):
+    """World matrix of the space obj's channels live in (parent, parent bone and parent inverse)."""
+    return obj.matrix_world @ obj.matrix_basis.inverted_safe()
+
+def rotation_to_quaternion(rot):
+    """Vectorised Matrix.to_quaternion() for (..., 3, 3) rotation matrices -> (..., 4) as (w, x, y, z), w >= 0."""
+    m00, m01, m02 = rot[..., 0, 0], rot[..., 0, 1], rot[..., 0, 2]
+    m10, m11, m12 = rot[..., 1, 0], rot[..., 1, 1], rot[..., 1, 2]
+    m20, m21, m22 = rot[..., 2, 0], rot[..., 2, 1], rot[..., 2, 2]
+    trace = m00 + m11 + m22
+
+    # Branch on the largest diagonal term for numerical stability
+    cases = (
+        (trace > 0,
+         lambda: 1.0 + trace,
+         lambda s: (0.25 * s, (m21 - m12) / s, (m02 - m20) / s, (m10 - m01) / s)),
+        ((m00 >= m11) & (m00 >= m22),
+         lambda: 1.0 + m00 - m11 - m22,
+         lambda s: ((m21 - m12) / s, 0.25 * s, (m01 + m10) / s, (m02 + m20) / s)),
+        (m11 >= m22,
+         lambda: 1.0 + m11 - m00 - m22,
+         lambda s: ((m02 - m20) / s, (m01 + m10) / s, 0.25 * s, (m12 + m21) / s)),
+        (np.ones_like(trace, dtype=bool),
+         lambda: 1.0 + m22 - m00 - m11,
+         lambda s: ((m10 - m01) / s, (m02 + m20) / s, (m12 + m21) / s, 0.25 * s)),
+    )
+    quat = np.zeros(rot.shape[:-2] + (4,))
+    todo = np.ones(trace.shape, dtype=bool)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for cond, radicand, comps in cases:
+            sel = todo & cond
+            s = 2.0 * np.sqrt(np.maximum(radicand(), 0.0))
+            quat[sel] = np.stack(comps(s), axis=-1)[sel]
+            todo &= ~cond
+
+    quat[quat[..., 0] < 0] *= -1.0
+    quat /= np.linalg.norm(quat, axis=-1, keepdims=True)
+    return np.nan_to_num(quat)
+
+def decompose_matrices(mats):
+    """Vectorised Matrix.decompose() for (..., 4, 4) matrices -> (..., _KEYED_VALUES)
+    laid out as location, quaternion (w, x, y, z), scale."""
+    loc = mats[..., :3, 3]
+    rs = mats[..., :3, :3]
+    scale = np.linalg.norm(rs, axis=-2)  # column lengths
+    scale[np.linalg.det(rs) < 0] *= -1.0  # negative scale flips all axes, like mathutils
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rot = np.nan_to_num(rs / scale[..., None, :])
+    return np.concatenate((loc, rotation_to_quaternion(rot), scale), axis=-1)
+
+def keyframe_co_buffer(frames):
+    """Interleaved (frame, value) buffer for foreach_set("co"), with the frames filled in."""
+    co = np.empty(len(frames) * 2, dtype=np.float32)
+    co[0::2] = frames
+    return co
+
+def write_baked_fcurves(obj, action_name, co, samples):
+    """Key obj's transform channels in one go from samples[_KEYED_VALUES, frame].
+    co comes from keyframe_co_buffer(); its value slots are overwritten per channel.
+    Channels that already exist are replaced."""
+    ad = obj.animation_data_create()  # returns the existing animation data if there is one
+    action = ad.action
+    fresh = action is None
+    if fresh:
+        action = bpy.data.actions.new(action_name)
+        ad.action = action
+    else:
+        action.name = action_name
+
+    fcurves = action.fcurves
+    count = len(co) // 2
+    col = 0
+    for path, size in _KEYED_CHANNELS:
+        for index in range(size):
+            # A new action has no curves to replace, so skip the lookups on first bake
+            fc = None if fresh else fcurves.find(path, index=index)
+            if fc is not None:
+                fcurves.remove(fc)
+            fc = fcurves.new(path, index=index, action_group="Object Transforms")
+            fc.keyframe_points.add(count)
+            co[1::2] = samples[col]
+            fc.keyframe_points.foreach_set("co", co)
+            fc.update()
+            col += 1
+    return action
+
+
+def make_pose_matrix_reader(arm_obj, pose_bones):
+    """Return read() -> (N, 4, 4) array of the current pose matrices of pose_bones.
+    Uses one foreach_get over the whole pose, falling back to per-bone reads if unsupported."""
+    all_bones = arm_obj.pose.bones
+    buf = np.empty(len(all_bones) * 16, dtype=np.float32)
+    # Built per bake: a script can rename bones between bakes without any depsgraph update
+    index = {pb.name: i for i, pb in enumerate(all_bones)}
+    idx = np.array([index[pb.name] for pb in pose_bones], dtype=np.intp)
+
+    def read_bulk():
+        all_bones.foreach_get("matrix", buf)
+        # RNA stores matrices column-major
+        return buf.reshape(-1, 4, 4).transpose(0, 2, 1)[idx]
+
+    def read_each():
+        return np.array([pb.matrix for pb in pose_bones])
+
+    try:
+        read_bulk()
+    except (TypeError, AttributeError, RuntimeError):
+        return read_each
+    return read_bulk
+
+def fast_bake_blocker(arm_obj):
+    """Return why the armature's pose can't be computed straight from its action
+    (anything else that moves bones needs a scene evaluation), or None if it can."""
+    ad = arm_obj.animation_data
+    if ad is None or ad.action is None:
+        return "no active action"
+    if ad.drivers or (arm_obj.data.animation_data and arm_obj.data.animation_data.drivers):
+        return "drivers"
+    if any(not t.mute for t in ad.nla_tracks) or ad.action_influence < 1.0:
+        return "NLA or action influence"
+    if arm_obj.data.pose_position != 'POSE':
+        return "armature in rest position"
+    if arm_obj.parent or arm_obj.constraints:
+        return "armature is parented or constrained"
+    if any(pb.constraints for pb in arm_obj.pose.bones):
+        return "bone constraints"
+    if any(not fc.data_path.startswith(("pose.bones[", '["')) for fc in ad.action.fcurves):
+        return "object transform animation"
+    return None
+
+def make_pose_evaluator(arm_obj, pose_bones):
+    """Return evaluate(frame) -> [pose-space Matrix for each of pose_bones], computed from the
+    armature's action fcurves without touching the scene. Only valid if fast_bake_blocker() is None."""
+    # Same skips as Blender's own evaluation: muted curves or groups, disabled curves, and
+    # curves with neither keys nor modifiers (which would otherwise evaluate to 0)
+    fcurves = {(fc.data_path, fc.array_index): fc
+               for fc in arm_obj.animation_data.action.fcurves
+               if not fc.mute and not (fc.group and fc.group.mute) and fc.is_valid
+               and (len(fc.keyframe_points) or len(fc.modifiers))}
+
+    def channel(pb, prop):
+        # (fcurve or None, current value) per array index; un-animated channels stay constant
+        path = pb.path_from_id(prop)
+        return [(fcurves.get((path, i)), v) for i, v in enumerate(getattr(pb, prop))]
+
+    # Requested bones plus their ancestors, parents before children
+    needed = {}
+    for pb in pose_bones:
+        for p in (pb, *pb.parent_recursive):
+            needed[p.name] = p
+
+    plan = []
+    for pb in sorted(needed.values(), key=lambda p: len(p.parent_recursive)):
+        mode = pb.rotation_mode
+        rot_prop = {'QUATERNION': "rotation_quaternion", 'AXIS_ANGLE': "rotation_axis_angle"}.get(mode, "rotation_euler")
+        parent = pb.parent.name if pb.parent else None
+        plan.append((pb.name, pb.bone, parent, mode,
+                     channel(pb, "location"), channel(pb, rot_prop), channel(pb, "scale")))
+    names = [pb.name for pb in pose_bones]
+
+    def sample(chan, frame):
+        return [fc.evaluate(frame) if fc else v for fc, v in chan]
+
+    def evaluate(frame):
+        mats = {}
+        for name, bone, parent, mode, loc_ch, rot_ch, scl_ch in plan:
+            r = sample(rot_ch, frame)
+            if mode == 'QUATERNION':
+                rot = Quaternion(r).normalized()
+            elif mode == 'AXIS_ANGLE':
+                rot = Quaternion(r[1:], r[0])
+            else:
+                rot = Euler(r, mode)
+            basis = Matrix.LocRotScale(sample(loc_ch, frame), rot, sample(scl_ch, frame))
+            if parent is None:
+                mats[name] = bone.convert_local_to_pose(basis, bone.matrix_local)
+            else:
+                mats[name] = bone.convert_local_to_pose(
+                    basis, bone.matrix_local,
+                    parent_matrix=mats[parent], parent_matrix_local=bone.parent.matrix_local)
+        return [mats[n] for n in names]
+
+    return evaluate
+
+
 def bone_name_from_empty_name(arm_obj, empty_obj):
     p = f"CTRL_{arm_obj.name}_"
     return empty_obj.name[len(p):] if empty_obj.name.startswith(p) else None
@@ -99,9 +407,11 @@ class EDMToolsBakeProps(bpy.types.PropertyGroup):
     only_selected_bones: BoolProperty(default=False)
 
     show_general_settings: bpy.props.BoolProperty(default=False)
+    # Name shown in the panel, kept up to date by _refresh_active_arm_label()
+    active_arm_label: StringProperty(default="None")
 
-    frame_start: IntProperty(name="Start", default=0)
-    frame_end:   IntProperty(name="End",   default=200)
+    # (start, end) in one property, so editing the range is a single update
+    frame_range: IntVectorProperty(name="Range", size=2, default=(0, 200))
 
     action_number: IntProperty(name="Number", default=0, min=0)
     action_name:   StringProperty(name="Name", default="animation")
@@ -113,6 +423,230 @@ class EDMToolsBakeProps(bpy.types.PropertyGroup):
         name="Group Empties in Collection", default=True)
     do_reparent: BoolProperty(
         name="Reparent Bone Children to Empties", default=True)
+    fast_mode: BoolProperty(
+        name="Fast Bake (no scene eval)",
+        description="Compute bone transforms straight from the armature's action instead of "
+                    "evaluating the scene each frame. Falls back to a full bake when drivers, "
+                    "constraints or NLA are involved",
+        default=False)
+    verbose_reports: BoolProperty(
+        name="Report Each Step",
+        description="Show a summary in the status bar after every bake/unbake. When off, only "
+                    "warnings, errors and one summary per Rebake are reported",
+        default=True)
+
+# ---------------- Bake / revert ----------------
+
+def prepare_bake(context, arm):
+    """Check the bake settings for arm. Returns (bones to bake, None), or (None, (level, message))
+    describing why the bake can't run, so callers can refuse before changing anything."""
+    props = context.scene.edm_tools_bake
+    fs, fe = props.frame_range
+    if fe < fs:
+        return None, ({'ERROR'}, "End frame must not be before start frame")
+
+    bones = filter_pose_bones(context, arm, props)
+    if not bones:
+        return None, ({'WARNING'}, "No bones to process")
+    return bones, None
+
+def bake_armature(op, context, arm):
+    """Bake arm's bones to empties; op receives the reports. Returns an operator result set."""
+    bones, problem = prepare_bake(context, arm)
+    if problem:
+        op.report(*problem)
+        return {'CANCELLED'}
+
+    props = context.scene.edm_tools_bake
+    fs, fe = props.frame_range
+
+    coll = make_controls_collection_for_armature(context, arm) if props.create_parent_collection else None
+    pairs = []  # (pbone, empty)
+    # Snapshot existing empties and collection members once instead of per bone
+    if _BAKED_EMPTIES_PROP in arm:
+        stored = stored_baked_empties(context, arm)
+        existing = {o.name: o for o in stored}
+        known = {o.name: bone for o, bone in stored.items()}
+    else:
+        ctrl_prefix = empty_name_for(arm, "")
+        existing = {o.name: o for o in context.scene.objects if o.name.startswith(ctrl_prefix)}
+        known = {name: bone_name_from_empty_name(arm, o) for name, o in existing.items()}
+    in_coll = set(coll.objects.keys()) if coll else None
+    for pbone in bones:
+        e = get_or_create_empty_for_bone(context, arm, pbone, coll, existing, in_coll)
+
+        e.empty_display_type = 'PLAIN_AXES'
+        e.empty_display_size = props.empty_size
+
+        # Parent empties like the armature is parented (including bone parenting)
+        saved = e.matrix_world.copy()
+        if arm.parent:
+            e.parent      = arm.parent
+            e.parent_type = arm.parent_type
+            if arm.parent_type == 'BONE':
+                e.parent_bone = arm.parent_bone
+        else:
+            e.parent = None
+            e.parent_type = 'OBJECT'
+            e.parent_bone = ""
+        e.matrix_world = saved
+
+        e.rotation_mode = 'QUATERNION'
+        e[_BAKED_OWNER_PROP] = arm
+        pairs.append((pbone, e))
+
+    # Remember every empty baked for this armature so later bakes and the revert can skip scene scans
+    known.update((e.name, pb.name) for pb, e in pairs)
+    arm[_BAKED_EMPTIES_PROP] = {name: bone for name, bone in known.items() if bone}
+
+    scene = context.scene
+    cur = scene.frame_current
+
+    # Sample every frame first, then write all keys per channel in bulk
+    frames = np.arange(fs, fe + 1, dtype=np.float32)
+    pbones = [pb for pb, _ in pairs]
+    empties = [e for _, e in pairs]
+    parented = any(e.parent for e in empties)
+    if parented:
+        # All empties share the armature's parent, so their parent spaces only differ by
+        # their parent inverse: inv(space_i) = inv(MPI_i) @ MPI_0 @ inv(space_0)
+        mpi0 = empties[0].matrix_parent_inverse
+        rel = np.array([e.matrix_parent_inverse.inverted_safe() @ mpi0 for e in empties])
+    world = np.empty((len(pairs), len(frames), 4, 4))  # empty channel-space matrices
+
+    # Name actions: <number>_<name>_<bone>
+    prefix = str(props.action_number)
+    suffix = props.action_name.strip()
+    common = f"{prefix}_{suffix}" if suffix else prefix
+
+    evaluate = None
+    if props.fast_mode:
+        reason = fast_bake_blocker(arm)
+        if reason:
+            op.report({'WARNING'}, f"Fast Bake unavailable ({reason}), evaluating scene instead")
+        else:
+            evaluate = make_pose_evaluator(arm, pbones)
+            amw = np.array(arm.matrix_world)
+    if not evaluate:
+        read_pose = make_pose_matrix_reader(arm, pbones)
+
+    try:
+        for fi, f in enumerate(range(fs, fe + 1)):
+            if evaluate:
+                bone_mats = np.array(evaluate(f))
+            else:
+                scene.frame_set(f)  # evaluates the depsgraph and flushes the pose back
+                amw = np.array(arm.matrix_world)  # once per frame, not per bone
+                bone_mats = read_pose()
+            mats = amw @ bone_mats
+            if parented:
+                # One parent-space read per frame instead of one per empty
+                mats = rel @ np.array(parent_space_matrix(empties[0]).inverted_safe()) @ mats
+            world[:, fi] = mats
+
+        # Channel-major (empty, channel, frame) so each fcurve reads one contiguous row
+        samples = np.ascontiguousarray(decompose_matrices(world).transpose(0, 2, 1), dtype=np.float32)
+        co = keyframe_co_buffer(frames)  # shared by every fcurve
+        for i, (pbone, e) in enumerate(pairs):
+            write_baked_fcurves(e, f"{common}_{pbone.name}", co, samples[i])
+    finally:
+        if not evaluate:
+            scene.frame_set(cur)
+
+    if evaluate:
+        # Fast Bake never evaluated the scene, so new empties still sit at their creation
+        # transform; evaluate once so they're at their baked pose before children are reparented
+        context.view_layer.update()
+
+    # Reparent bone-children
+    if props.do_reparent:
+        map_empty = {pb.name: e for pb, e in pairs}
+        # Only the armature's own children can be bone-parented to it. arm.children scans
+        # bpy.data.objects once and returns a tuple, so reparenting while looping is safe.
+        for obj in arm.children:
+            if obj.parent_type != 'BONE':
+                continue
+            old_bone = obj.parent_bone
+            new_par = map_empty.get(old_bone)
+            if new_par is None:
+                continue
+            wmx = obj.matrix_world.copy()
+            # retarget constraints aimed at arm+bone -> empty
+            for con in obj.constraints:
+                if con.type in _TARGETING_CONSTRAINTS and con.target == arm and con.subtarget == old_bone:
+                    con.target, con.subtarget = new_par, ""
+            obj.parent = new_par
+            obj.parent_type = 'OBJECT'
+            obj.matrix_world = wmx
+
+    if props.verbose_reports:
+        op.report({'INFO'}, f"Baked {len(pairs)} empties ({fs}..{fe})")
+    return {'FINISHED'}
+
+
+def revert_bake(op, context, arm):
+    """Remove arm's baked empties and reparent their children back to the bones."""
+    coll = bpy.data.collections.get(controls_collection_name(arm))
+    emp2bone = find_baked_empties(context, arm)
+    if not emp2bone:
+        op.report({'WARNING'}, "No baked empties for this armature")
+        return {'CANCELLED'}
+    empties = list(emp2bone)
+
+    # Reparent objects back to armature bones in one scene pass (Object.children scans
+    # bpy.data.objects on every access, so asking each empty would be quadratic)
+    for obj in context.scene.objects:
+        emp = obj.parent
+        if emp is None or obj.type == 'EMPTY':
+            continue
+        bone = emp2bone.get(emp)
+        if not bone:  # not a baked empty, or one whose bone is unknown
+            continue
+        wmx = obj.matrix_world.copy()
+        # retarget constraints back to arm+bone
+        for con in obj.constraints:
+            if con.type in _TARGETING_CONSTRAINTS and con.target == emp:
+                con.target, con.subtarget = arm, bone
+        obj.parent = arm
+        obj.parent_type = 'BONE'
+        obj.parent_bone = bone
+        obj.matrix_world = wmx
+
+    # Collect & remove empty actions (as pointers, so nothing holds on to IDs across the removal)
+    baked = array('Q')
+    for e in empties:
+        if e.animation_data and e.animation_data.action:
+            baked.append(e.animation_data.action.as_pointer())
+    # One bulk delete instead of an ID remap per empty
+    n_empties = len(empties)
+    bpy.data.batch_remove(ids=empties)
+    arm.pop(_BAKED_EMPTIES_PROP, None)
+    # Not bpy.data.orphans_purge(): it can't be limited to these actions and would also
+    # delete every other orphaned datablock in the user's file
+    dead = ()
+    if baked:
+        baked = set(baked)
+        actions = bpy.data.actions
+        users = np.empty(len(actions), dtype=np.int32)
+        actions.foreach_get("users", users)
+        # Only zero-user actions are visited in Python, then matched against the baked ones
+        unused = (actions[i] for i in np.flatnonzero(users == 0).tolist())
+        dead = [a for a in unused if a.as_pointer() in baked]
+        for act in dead:
+            # Nothing uses them any more, so skip the ID remap/user cleanup remove() would do
+            actions.remove(act, do_unlink=False, do_id_user=False)
+
+    if coll:
+        # only remove if it's now empty (no objects, no child collections)
+        if not coll.objects and not coll.children:
+            # remove() also unlinks it from the scene and any parent collections
+            bpy.data.collections.remove(coll)
+
+    if context.scene.edm_tools_bake.verbose_reports:
+        op.report({'INFO'}, f"Reverted bake for '{arm.name}' "
+                            f"({n_empties} empties, {len(dead)} actions removed)")
+    return {'FINISHED'}
+
 
 # ---------------- Operators ----------------
 
@@ -127,158 +661,89 @@ class EDMTOOLS_OT_bake_empties_from_armature(bpy.types.Operator):
             self.report({'ERROR'}, "Active object must be an Armature")
             return {'CANCELLED'}
 
-        props = context.scene.edm_tools_bake
-        fs, fe = props.frame_start, props.frame_end
+        return bake_armature(self, context, arm)
 
-        bones = filter_pose_bones(context, arm, props)
-        if not bones:
-            self.report({'WARNING'}, "No bones to process")
-            return {'CANCELLED'}
 
-        coll = make_controls_collection_for_armature(context, arm) if props.create_parent_collection else None
-        pairs = []  # (pbone, empty)
-        for pbone in bones:
-            e = get_or_create_empty_for_bone(context, arm, pbone, coll)
-            if coll: ensure_only_in_collection(e, coll)
-
-            e.empty_display_type = 'PLAIN_AXES'
-            e.empty_display_size = props.empty_size
-
-            # Parent empties like the armature is parented (including bone parenting)
-            saved = e.matrix_world.copy()
-            if arm.parent:
-                e.parent      = arm.parent
-                e.parent_type = arm.parent_type
-                if arm.parent_type == 'BONE':
-                    e.parent_bone = arm.parent_bone
-            else:
-                e.parent = None
-                e.parent_type = 'OBJECT'
-                e.parent_bone = ""
-            e.matrix_world = saved
-
-            e.rotation_mode = 'QUATERNION'
-            pairs.append((pbone, e))
+class EDMTOOLS_OT_revert_bake(bpy.types.Operator):
+    bl_idname = "edmtools.revert_bake"
+    bl_label  = "UnBake Empties to Armature"
+    bl_options = {'REGISTER', 'UNDO'}
 
-        scene = context.scene
-        cur = scene.frame_current
-        deps = context.evaluated_depsgraph_get()
+    def execute(self, context):
+        arm = get_active_armature(context)
+        if not arm:
+            self.report({'ERROR'}, "Active object must be an Armature")
+            return {'CANCELLED'}
 
-        try:
-            for f in range(fs, fe + 1):
-                scene.frame_set(f); deps.update()
-                for pbone, e in pairs:
-                    e.matrix_world = (arm.matrix_world @ pbone.matrix).copy()
-                    e.keyframe_insert("location", frame=f)
-                    e.keyframe_insert("rotation_quaternion", frame=f)
-                    e.keyframe_insert("scale", frame=f)
-        finally:
-            scene.frame_set(cur)
+        return revert_bake(self, context, arm)
 
-        # Name actions: <number>_<name>_<bone>
-        prefix = str(props.action_number)
-        suffix = props.action_name.strip()
-        common = f"{prefix}_{suffix}" if suffix else prefix
-        for pbone, e in pairs:
-            if e.animation_data and e.animation_data.action:
-                e.animation_data.action.name = f"{common}_{pbone.name}"
-
-        # Reparent bone-children
-        if props.do_reparent:
-            map_empty = {pb.name: e for pb, e in pairs}
-            to_move = [
-                o for o in context.scene.objects
-                if o.parent == arm and o.parent_type == 'BONE' and o.parent_bone in map_empty
-            ]
-            for obj in to_move:
-                old_bone = obj.parent_bone
-                new_par = map_empty[old_bone]
-                wmx = obj.matrix_world.copy()
-                # retarget constraints aimed at arm+bone -> empty
-                for con in list(obj.constraints):
-                    if hasattr(con, "target") and hasattr(con, "subtarget"):
-                        if con.target == arm and con.subtarget == old_bone:
-                            con.target, con.subtarget = new_par, ""
-                obj.parent = new_par
-                obj.parent_type = 'OBJECT'
-                obj.matrix_world = wmx
-
-        self.report({'INFO'}, f"Baked {len(pairs)} empties ({fs}..{fe})")
-        return {'FINISHED'}
 
+# Bake steps run by EDMTOOLS_OT_bake_bulk for each mode, in order
+_BULK_STEPS = {
+    'BAKE':   (bake_armature,),
+    'REVERT': (revert_bake,),
+    'REBAKE': (revert_bake, bake_armature),
+}
 
-class EDMTOOLS_OT_revert_bake(bpy.types.Operator):
-    bl_idname = "edmtools.revert_bake"
-    bl_label  = "UnBake Empties to Armature"
+class EDMTOOLS_OT_bake_bulk(bpy.types.Operator):
+    """Run one or more bake steps on the active armature as a single operation and undo step"""
+    bl_idname = "edmtools.bake_bulk"
+    bl_label  = "Rebake Empties"
     bl_options = {'REGISTER', 'UNDO'}
 
+    mode: EnumProperty(
+        name="Mode",
+        items=[
+            ('BAKE',   "Bake",   "Bake empties from the armature"),
+            ('REVERT', "UnBake", "Remove the baked empties and reparent their children to the bones"),
+            ('REBAKE', "Rebake", "UnBake, then bake again from scratch (drops empties of bones no longer baked)"),
+        ],
+        default='REBAKE',
+    )
+
     def execute(self, context):
         arm = get_active_armature(context)
         if not arm:
             self.report({'ERROR'}, "Active object must be an Armature")
             return {'CANCELLED'}
 
-        prefix = f"CTRL_{arm.name}_"
-        empties = [o for o in context.scene.objects if o.type == 'EMPTY' and o.name.startswith(prefix)]
-        if not empties:
-            self.report({'WARNING'}, "No baked empties for this armature")
-            return {'CANCELLED'}
+        steps = _BULK_STEPS[self.mode]
+        if bake_armature in steps:
+            # Refuse up front, so a REBAKE can't revert and then fail to bake
+            _bones, problem = prepare_bake(context, arm)
+            if problem:
+                self.report(*problem)
+                return {'CANCELLED'}
+
+        window = context.window
+        if window:
+            window.cursor_set('WAIT')
+        result = {'CANCELLED'}
+        try:
+            for step in steps:
+                # Nothing baked yet: REBAKE just bakes, without revert's "no empties" warning
+                if step is revert_bake and self.mode == 'REBAKE' and not find_baked_empties(context, arm):
+                    continue
+                result = step(self, context, arm)
+                if result != {'FINISHED'}:
+                    break
+        finally:
+            if window:
+                window.cursor_set('DEFAULT')
+
+        if result == {'FINISHED'} and not context.scene.edm_tools_bake.verbose_reports:
+            # The steps stayed quiet, so report the whole run once
+            self.report({'INFO'}, f"{self.mode.title()} finished for '{arm.name}'")
+        return result
 
-        emp2bone = {e: bone_name_from_empty_name(arm, e) for e in empties}
-
-        # Reparent objects back to armature bones
-        for obj in list(context.scene.objects):
-            if obj.parent in emp2bone and obj.type != 'EMPTY':
-                bone = emp2bone[obj.parent]
-                wmx = obj.matrix_world.copy()
-                # retarget constraints back to arm+bone
-                for con in list(obj.constraints):
-                    if hasattr(con, "target") and hasattr(con, "subtarget"):
-                        if con.target == obj.parent:
-                            con.target, con.subtarget = arm, bone
-                obj.parent = arm
-                obj.parent_type = 'BONE'
-                obj.parent_bone = bone
-                obj.matrix_world = wmx
-
-        # Collect & remove empty actions
-        actions = set()
-        for e in empties:
-            if e.animation_data and e.animation_data.action:
-                actions.add(e.animation_data.action)
-        for e in empties:
-            bpy.data.objects.remove(e, do_unlink=True)
-        for a in actions:
-            if a.users == 0:
-                bpy.data.actions.remove(a, do_unlink=True)
-
-        coll_name = f"EDM_ArmatureCtrls_{arm.name}"
-        coll = bpy.data.collections.get(coll_name)
-        if coll:
-            # only remove if it's now empty (no objects, no child collections)
-            if not coll.objects and not coll.children:
-                # Unlink from Scene Collection if present
-                sc_children = context.scene.collection.children
-                for child in list(sc_children):
-                    if child == coll:
-                        sc_children.unlink(coll)
-                        break
-
-                # Unlink from any other parent collections
-                for parent in bpy.data.collections:
-                    for child in list(parent.children):
-                        if child == coll:
-                            parent.children.unlink(coll)
-                            break
-
-                # Finally remove the collection datablock
-                bpy.data.collections.remove(coll)
-
-        self.report({'INFO'}, f"Reverted bake for '{arm.name}' ({len(empties)} empties removed)")
-        return {'FINISHED'}
 
 # ---------------- UI (subpanel) ----------------
 
+# Operator ids drawn by the panel, resolved once
+_BAKE_IDNAME = EDMTOOLS_OT_bake_empties_from_armature.bl_idname
+_REVERT_IDNAME = EDMTOOLS_OT_revert_bake.bl_idname
+_BULK_IDNAME = EDMTOOLS_OT_bake_bulk.bl_idname
+
 class EDMTOOLS_PT_bake_subpanel(bpy.types.Panel):
     bl_label = "Bake Empties"
     bl_space_type = 'VIEW_3D'
@@ -287,16 +752,21 @@ class EDMTOOLS_PT_bake_subpanel(bpy.types.Panel):
     bl_parent_id = "EDMTOOLS_PT_root"         # attach under the root panel
     bl_options = {'DEFAULT_CLOSED'}           # collapsible dropdown
 
+    # (active_arm_label, header text) from the last redraw; only re-formatted when the label changes
+    _arm_header = ("None", "Active Armature: None")
+
     def draw(self, context):
         props = context.scene.edm_tools_bake
         layout = self.layout
-        arm = get_active_armature(context)
 
         # Active Armature Box
         box = layout.box()
         col = box.column(align=True)
 
-        col.label(text=f"Active Armature: {arm.name if arm else 'None'}", icon='ARMATURE_DATA')
+        label = props.active_arm_label
+        if label != self._arm_header[0]:
+            type(self)._arm_header = (label, f"Active Armature: {label}")
+        col.label(text=self._arm_header[1], icon='ARMATURE_DATA')
 
         # ------------------------
         # General Settings (Dropdown)
@@ -318,6 +788,8 @@ class EDMTOOLS_PT_bake_subpanel(bpy.types.Panel):
 
             col.prop(props, "create_parent_collection")
             col.prop(props, "do_reparent")
+            col.prop(props, "fast_mode")
+            col.prop(props, "verbose_reports")
 
             col.separator(type='LINE', factor=2)
 
@@ -328,8 +800,8 @@ class EDMTOOLS_PT_bake_subpanel(bpy.types.Panel):
             col.label(text="Bake Range:")
 
             r = col.row(align=True)
-            r.prop(props, "frame_start")
-            r.prop(props, "frame_end")
+            r.prop(props, "frame_range", index=0, text="Start")
+            r.prop(props, "frame_range", index=1, text="End")
 
         # ------------------------
         # Animation Settings (Always Visible)
@@ -360,8 +832,9 @@ class EDMTOOLS_PT_bake_subpanel(bpy.types.Panel):
         box = layout.box()
         col = box.column(align=True)
 
-        col.operator(EDMTOOLS_OT_bake_empties_from_armature.bl_idname, icon='ACTION')
-        col.operator(EDMTOOLS_OT_revert_bake.bl_idname, icon='TRASH')
+        col.operator(_BAKE_IDNAME, icon='ACTION')
+        col.operator(_BULK_IDNAME, icon='FILE_REFRESH').mode = 'REBAKE'
+        col.operator(_REVERT_IDNAME, icon='TRASH')
 
 # ---------------- Register ----------------
 
@@ -369,16 +842,37 @@ _classes = (
     EDMToolsBakeProps,
     EDMTOOLS_OT_bake_empties_from_armature,
     EDMTOOLS_OT_revert_bake,
+    EDMTOOLS_OT_bake_bulk,
     EDMTOOLS_PT_bake_subpanel,
 )
 
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(_classes)
+
+def _refresh_label_after_register():
+    # register() only gets a restricted context, so fill in the panel label once the addon
+    # enable has returned (timers never run in background mode, where there's no panel)
+    _refresh_active_arm_label(bpy.context.scene, bpy.context.view_layer)
+    return None
+
 def register():
-    for c in _classes:
-        bpy.utils.register_class(c)
+    _register_classes()
     bpy.types.Scene.edm_tools_bake = PointerProperty(type=EDMToolsBakeProps)
 
+    for handlers, fn in _LABEL_HANDLERS:
+        if fn not in handlers:
+            handlers.append(fn)
+    bpy.app.timers.register(_refresh_label_after_register, first_interval=0.0)
+
 def unregister():
-    for c in reversed(_classes):
-        bpy.utils.unregister_class(c)
-    if hasattr(bpy.types.Scene, "edm_tools_bake"):
+    if bpy.app.timers.is_registered(_refresh_label_after_register):
+        bpy.app.timers.unregister(_refresh_label_after_register)
+
+    for handlers, fn in _LABEL_HANDLERS:
+        if fn in handlers:
+            handlers.remove(fn)
+
+    _unregister_classes()
+    try:
         del bpy.types.Scene.edm_tools_bake
+    except AttributeError:
+        pass
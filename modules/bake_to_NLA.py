@@ -6,6 +6,9 @@ from bpy.props import PointerProperty
 
 BAKE_SUFFIX = "_BAKED"
 
+# The NLA baker is retired (see CHANGELOG), so its classes are only registered when this is True
+DEBUG_LEGACY = False
+
 
 # -------------------------------------------------------
 # Helpers
@@ -303,14 +306,16 @@ _classes = (
     EDMTOOLS_PT_nla_panel,
 )
 
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(
+    _classes if DEBUG_LEGACY else ()
+)
+
 
 def register():
 
-    for c in _classes:
-        bpy.utils.register_class(c)
+    _register_classes()
 
 
 def unregister():
 
-    for c in reversed(_classes):
-        bpy.utils.unregister_class(c)
\ No newline at end of file
+    _unregister_classes()
\ No newline at end of file
@@ -34,32 +34,106 @@ def _norm_dir(path: str) -> str:
     return abspath
 
 
-def _safe_relpath(full_path: str, base_dir: str) -> str | None:
-    """Try to get a relpath; return None if it can't be made relative."""
-    try:
-        return os.path.relpath(full_path, base_dir)
-    except Exception:
-        return None
+# {image session_uid: (filepath token, normalized absolute path)}; kept out of the .blend
+_ABS_CACHE = {}
 
 
-def _iter_image_nodes_in_materials():
-    """Yield (material, node) for all TEX_IMAGE nodes with an image."""
-    for mat in bpy.data.materials:
-        if not mat or not mat.use_nodes or not mat.node_tree:
-            continue
-        for node in mat.node_tree.nodes:
-            if node and node.type == 'TEX_IMAGE' and getattr(node, "image", None):
-                yield mat, node
+def _img_abs(img) -> str:
+    """Normalized absolute path of img.filepath, cached per image.
 
+    The cache is keyed on the filepath (plus the .blend path for // relative paths),
+    so it refreshes by itself whenever either changes.
+    """
+    src = img.filepath
+    if not src:
+        return ""
+    token = bpy.data.filepath + "|" + src if src.startswith("//") else src
+    cached = _ABS_CACHE.get(img.session_uid)
+    if cached is not None and cached[0] == token:
+        return cached[1]
+    abspath = os.path.normpath(bpy.path.abspath(src))
+    _ABS_CACHE[img.session_uid] = (token, abspath)
+    return abspath
 
-def _iter_image_nodes_in_worlds():
-    """Yield (world, node) for all TEX_IMAGE nodes with an image."""
-    for w in bpy.data.worlds:
-        if not w or not w.use_nodes or not w.node_tree:
-            continue
-        for node in w.node_tree.nodes:
-            if node and node.type == 'TEX_IMAGE' and getattr(node, "image", None):
-                yield w, node
+
+def _make_exists_check():
+    """Return exists(path) that lists each folder once and answers from that listing,
+    instead of a stat call per file (slow on network drives)."""
+    listings = {}
+
+    def exists(path: str) -> bool:
+        folder, name = os.path.split(path)
+        names = listings.get(folder)
+        if names is None:
+            try:
+                names = {os.path.normcase(n) for n in os.listdir(folder)}
+            except OSError:
+                names = set()
+            listings[folder] = names
+        return os.path.normcase(name) in names
+
+    return exists
+
+
+def _iter_node_images(*id_collections):
+    """Yield the image of every TEX_IMAGE node in the given materials/worlds."""
+    for ids in id_collections:
+        for owner in ids:
+            if not owner or not owner.use_nodes or not owner.node_tree:
+                continue
+            for node in owner.node_tree.nodes:
+                if node and node.type == 'TEX_IMAGE':
+                    img = getattr(node, "image", None)
+                    if img:
+                        yield img
+
+
+# Images referenced by shader nodes; rebuilt only after materials/worlds change.
+# "gen" is bumped by the handlers below, "key" records what "imgs" was built from.
+_IMG_CACHE = {"gen": 0, "key": None, "imgs": frozenset()}
+
+
+def _invalidate_image_cache():
+    _IMG_CACHE["gen"] += 1
+    _IMG_CACHE["imgs"] = frozenset()
+
+
+@bpy.app.handlers.persistent
+def _on_depsgraph_update(scene, depsgraph):
+    if any(depsgraph.id_type_updated(t) for t in ('MATERIAL', 'WORLD', 'NODETREE', 'IMAGE')):
+        _invalidate_image_cache()
+
+
+@bpy.app.handlers.persistent
+def _on_data_replaced(*_args):
+    # Loading a file or undo/redo replaces every datablock, so cached references are stale
+    _invalidate_image_cache()
+    _ABS_CACHE.clear()
+
+
+_CACHE_HANDLERS = (
+    (bpy.app.handlers.depsgraph_update_post, _on_depsgraph_update),
+    (bpy.app.handlers.load_post, _on_data_replaced),
+    (bpy.app.handlers.undo_post, _on_data_replaced),
+    (bpy.app.handlers.redo_post, _on_data_replaced),
+)
+
+
+def _collect_referenced_images():
+    """All images used by shader nodes in materials and worlds (cached)."""
+    key = (_IMG_CACHE["gen"], len(bpy.data.materials), len(bpy.data.worlds))
+    if _IMG_CACHE["key"] == key:
+        # A script can remove an image between calls without any depsgraph update;
+        # touching a removed image raises ReferenceError, so rebuild in that case
+        try:
+            for img in _IMG_CACHE["imgs"]:
+                img.name
+        except ReferenceError:
+            _IMG_CACHE["key"] = None
+    if _IMG_CACHE["key"] != key:
+        _IMG_CACHE["imgs"] = frozenset(_iter_node_images(bpy.data.materials, bpy.data.worlds))
+        _IMG_CACHE["key"] = key
+    return _IMG_CACHE["imgs"]
 
 
 def _update_tracked_images(context, old_base: str, new_base: str, reload_images: bool, create_tracking: bool):
@@ -73,17 +147,24 @@ def _update_tracked_images(context, old_base: str, new_base: str, reload_images:
     if not new_base_n or not os.path.isdir(new_base_n):
         return (0, 0, 0, 0, "New base path is empty or not a directory")
 
+    # Same base and nothing new to track: every tracked path is already correct
+    if old_base_n == new_base_n and not create_tracking:
+        return (0, 0, 0, 0, "Base path unchanged")
+
+    # Case-folded prefixes for matching (no-op outside Windows); both bases end with a
+    # separator, so the part of a matching path after the prefix is its relpath
+    new_key = os.path.normcase(new_base_n)
+    old_key = os.path.normcase(old_base_n)
+
     # Collect images referenced by shader editor nodes (materials + worlds)
-    referenced_images = set()
-    for _, node in _iter_image_nodes_in_materials():
-        referenced_images.add(node.image)
-    for _, node in _iter_image_nodes_in_worlds():
-        referenced_images.add(node.image)
+    referenced_images = _collect_referenced_images()
 
     tracked = 0
     updated = 0
     skipped_packed = 0
     missing_files = 0
+    file_exists = _make_exists_check()
+    changed = []  # images whose filepath was rewritten
 
     for img in referenced_images:
         if img is None:
@@ -95,24 +176,21 @@ def _update_tracked_images(context, old_base: str, new_base: str, reload_images:
             continue
 
         # Determine the "source path" we use to compute tracking / relpath
-        img_abs = bpy.path.abspath(img.filepath) if img.filepath else ""
-        img_abs = os.path.normpath(img_abs) if img_abs else ""
+        img_abs = _img_abs(img)
 
         # If we already track a relpath, use it.
         rel = img.get("edmtools_relpath", None)
 
-        # If we already track a relpath, use it.
-        rel = img.get("edmtools_relpath", None)
-        
         # Optionally create tracking data if missing.
         if rel is None and create_tracking:
             # Prefer computing relpath from NEW base (what the user is setting now)
-            if img_abs and img_abs.startswith(new_base_n):
-                rel = _safe_relpath(img_abs, new_base_n)
+            img_key = os.path.normcase(img_abs)
+            if img_abs and img_key.startswith(new_key):
+                rel = img_abs[len(new_key):]
         
             # If it isn't inside new base, fall back to old base (if any)
-            if (not rel) and old_base_n and img_abs and img_abs.startswith(old_base_n):
-                rel = _safe_relpath(img_abs, old_base_n)
+            if (not rel) and old_key and img_abs and img_key.startswith(old_key):
+                rel = img_abs[len(old_key):]
         
             # Final fallback: just the filename (no subfolders)
             if not rel:
@@ -121,23 +199,29 @@ def _update_tracked_images(context, old_base: str, new_base: str, reload_images:
             img["edmtools_relpath"] = rel
 
         # If still untracked, we can't confidently rebuild
-        rel = img.get("edmtools_relpath", None)
         if not rel:
             continue
 
         tracked += 1
         new_full = os.path.normpath(os.path.join(new_base_n, rel))
 
-        # Write as Blender-friendly path (absolute is fine; Blender also supports //)
-        img.filepath = new_full
-
         # Count missing targets (helpful feedback)
-        if not os.path.exists(bpy.path.abspath(img.filepath)):
+        if not file_exists(new_full):
             missing_files += 1
         else:
             updated += 1
 
-        if reload_images:
+        # Already pointing there: don't dirty or reload the image
+        if new_full == img_abs:
+            continue
+
+        # Write as Blender-friendly path (absolute is fine; Blender also supports //)
+        img.filepath = new_full
+        changed.append(img)
+
+    # Reload in one pass after all paths are rewritten
+    if reload_images:
+        for img in changed:
             try:
                 img.reload()
             except Exception:
@@ -149,15 +233,15 @@ def _update_tracked_images(context, old_base: str, new_base: str, reload_images:
 
 # ---------------- Properties ----------------
 
-def _on_base_path_changed(self, context):
-    """Auto-apply when base path changes (if enabled)."""
-    props = context.scene.edm_tools_image_base_path
+# Auto-apply is debounced: edits only mark the scene as pending, and the actual
+# update runs once the base path has been left alone for _DEBOUNCE_SECONDS.
+_DEBOUNCE_SECONDS = 0.3
+_pending_scenes = set()  # scene names (not references, which can go stale)
 
-    # Avoid doing work until the user actually enables auto-apply
-    if not props.auto_apply:
-        props.last_base_path = props.base_path
-        return
 
+def _apply_base_path_change(context, scene):
+    """Rewrite tracked images from the scene's last applied base to its current base."""
+    props = scene.edm_tools_image_base_path
     old_base = props.last_base_path
     new_base = props.base_path
 
@@ -182,6 +266,38 @@ def _on_base_path_changed(self, context):
         print(f"[EDM Tools] Image Base Path: tracked={tracked}, updated={updated}, packed_skipped={skipped_packed}, missing={missing}")
 
 
+def _flush_pending_base_paths():
+    """Timer callback: apply the latest base path of every scene edited since the last run."""
+    names = list(_pending_scenes)
+    _pending_scenes.clear()
+    for name in names:
+        scene = bpy.data.scenes.get(name)
+        if scene is not None and scene.edm_tools_image_base_path.auto_apply:
+            _apply_base_path_change(bpy.context, scene)
+    return None  # one-shot
+
+
+def _on_base_path_changed(self, context):
+    """Auto-apply when base path changes (if enabled)."""
+    props = context.scene.edm_tools_image_base_path
+
+    # Avoid doing work until the user actually enables auto-apply
+    if not props.auto_apply:
+        props.last_base_path = props.base_path
+        return
+
+    # Timers never run in background mode, so scripts get the change applied right away
+    if bpy.app.background:
+        _apply_base_path_change(context, context.scene)
+        return
+
+    # (Re)start the timer so a burst of edits is applied once
+    _pending_scenes.add(context.scene.name)
+    if bpy.app.timers.is_registered(_flush_pending_base_paths):
+        bpy.app.timers.unregister(_flush_pending_base_paths)
+    bpy.app.timers.register(_flush_pending_base_paths, first_interval=_DEBOUNCE_SECONDS)
+
+
 class EDMToolsImageBasePathProps(bpy.types.PropertyGroup):
     """Properties for Image Base Path module."""
 
@@ -268,11 +384,7 @@ class EDMTOOLS_OT_clear_image_tracking(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        referenced_images = set()
-        for _, node in _iter_image_nodes_in_materials():
-            referenced_images.add(node.image)
-        for _, node in _iter_image_nodes_in_worlds():
-            referenced_images.add(node.image)
+        referenced_images = _collect_referenced_images()
 
         cleared = 0
         for img in referenced_images:
@@ -334,17 +446,33 @@ _classes = (
     EDMTOOLS_PT_image_base_path_subpanel,
 )
 
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(_classes)
+
 def register():
-    for c in _classes:
-        bpy.utils.register_class(c)
+    _register_classes()
 
     bpy.types.Scene.edm_tools_image_base_path = PointerProperty(
         type=EDMToolsImageBasePathProps
     )
 
+    for handlers, fn in _CACHE_HANDLERS:
+        if fn not in handlers:
+            handlers.append(fn)
+
 def unregister():
-    for c in reversed(_classes):
-        bpy.utils.unregister_class(c)
+    for handlers, fn in _CACHE_HANDLERS:
+        if fn in handlers:
+            handlers.remove(fn)
+    _invalidate_image_cache()
+    _ABS_CACHE.clear()
+
+    if bpy.app.timers.is_registered(_flush_pending_base_paths):
+        bpy.app.timers.unregister(_flush_pending_base_paths)
+    _pending_scenes.clear()
 
-    if hasattr(bpy.types.Scene, "edm_tools_image_base_path"):
+    _unregister_classes()
+
+    try:
         del bpy.types.Scene.edm_tools_image_base_path
+    except AttributeError:
+        pass
@@ -9,15 +9,10 @@ from bpy.props import (
     PointerProperty,
     FloatProperty,
 )
-from mathutils import Vector
+from mathutils import Matrix, Vector
 
 # ---------------- Helpers ----------------
 
-def get_active_object(context):
-    obj = context.object
-    return obj if obj is not None else None
-
-
 def get_clickables_collection(context):
     """Ensure there's a top-level 'CLICKABLES' collection under the Scene Collection."""
     scene_coll = context.scene.collection
@@ -27,8 +22,8 @@ def get_clickables_collection(context):
         coll = bpy.data.collections.new("CLICKABLES")
         scene_coll.children.link(coll)
     else:
-        # Make sure it's linked under the Scene Collection (check by name)
-        if coll.name not in scene_coll.children:
+        # Make sure it's linked under the Scene Collection (name lookup, no list scan)
+        if scene_coll.children.get(coll.name) is None:
             scene_coll.children.link(coll)
 
     return coll
@@ -49,37 +44,19 @@ def generate_box_name(props):
 
 
 def parent_keep_transform(child, parent, context):
-    """Parent child to parent using the real 'Parent > Object (Keep Transform)' operator."""
+    """Parent child to parent like 'Parent > Object (Keep Transform)', without the operator
+    (no selection changes, mode switch or depsgraph update)."""
     if child is None or parent is None:
         return
 
-    view_layer = context.view_layer
-
-    # Save previous selection and active object
-    prev_active = view_layer.objects.active
-    prev_selection = [o for o in view_layer.objects if o.select_get()]
-
-    # Ensure we're in Object mode (operator requirement)
-    if context.mode != 'OBJECT':
-        try:
-            bpy.ops.object.mode_set(mode='OBJECT')
-        except Exception:
-            pass
-
-    # Prepare selection for parenting op
-    bpy.ops.object.select_all(action='DESELECT')
-    parent.select_set(True)
-    child.select_set(True)
-    view_layer.objects.active = parent
-
-    bpy.ops.object.parent_set(type='OBJECT', keep_transform=True)
+    world = child.matrix_world.copy()
 
-    # Restore previous selection (we override selection at the end of the op anyway)
-    bpy.ops.object.select_all(action='DESELECT')
-    for o in prev_selection:
-        if o.name in context.view_layer.objects:
-            o.select_set(True)
-    view_layer.objects.active = prev_active
+    child.parent = parent
+    child.parent_type = 'OBJECT'
+    # Same parent inverse parent_set() stores, so the parent's current transform is cancelled
+    child.matrix_parent_inverse = parent.matrix_world.inverted_safe()
+    # ...which makes the child's old world matrix its new local transform
+    child.matrix_basis = world
 
 
 def set_edm_special_type(obj, enum_key: str):
@@ -203,9 +180,11 @@ class EDMTOOLS_OT_rig_clickable(bpy.types.Operator):
         box_name      = generate_box_name(props)
         arg_number    = props.arg_number
 
-        # World-space transform of the object
-        obj_world     = obj.matrix_world.copy()
-        obj_origin_ws = obj_world.translation
+        # Read the object's transform and bounds once
+        mw     = obj.matrix_world.copy()         # world-space transform
+        origin = mw.translation.copy()
+        bb     = obj.bound_box
+        dims   = obj.dimensions[:]               # world-space dims
 
         # ---------------- Animation empty ----------------
         # Just mesh name + _CTRL
@@ -217,10 +196,10 @@ class EDMTOOLS_OT_rig_clickable(bpy.types.Operator):
 
         if props.copy_object_rotation:
             # Match full transform (pos + rot + scale)
-            anim_empty.matrix_world = obj_world
+            anim_empty.matrix_world = mw
         else:
             # Only match origin position
-            anim_empty.matrix_world.translation = obj_origin_ws
+            anim_empty.matrix_world.translation = origin
 
         collection.objects.link(anim_empty)
 
@@ -231,37 +210,28 @@ class EDMTOOLS_OT_rig_clickable(bpy.types.Operator):
 
         # ---------------- Action ----------------
         action = bpy.data.actions.new(action_name)
-        anim_empty.animation_data_create()
-        anim_empty.animation_data.action = action
+        anim_empty.animation_data_create().action = action
 
         # ---------------- Box empty ----------------
         box_empty = bpy.data.objects.new(box_name, None)
         box_empty.empty_display_type = 'CUBE'
         box_empty.empty_display_size = 1.0  # base "1m" local size
-        box_empty.scale = (1.0, 1.0, 1.0)
-
-        # Start with same rotation/scale as the object
-        box_empty.matrix_world = obj_world
 
         # Compute bounding box center in WORLD space
-        if obj.bound_box:
-            bb_local_pts = [Vector(corner) for corner in obj.bound_box]
-            center_local = sum(bb_local_pts, Vector()) / 8.0
-            center_world = obj.matrix_world @ center_local
+        if bb:
+            cx = cy = cz = 0.0
+            for c in bb:
+                cx += c[0]; cy += c[1]; cz += c[2]
+            center_world = mw @ Vector((cx * 0.125, cy * 0.125, cz * 0.125))
         else:
-            center_world = obj_origin_ws
-
-        # Set the box empty's pivot to the geometry center
-        box_empty.matrix_world.translation = center_world
+            center_world = origin
 
-        # Apply rotation locks from UI selection
-        box_empty.lock_rotation[0] = props.lock_rot_x
-        box_empty.lock_rotation[1] = props.lock_rot_y
-        box_empty.lock_rotation[2] = props.lock_rot_z
+        # Same rotation/scale as the object unless sized to the bounds below
+        _loc, rot, (sx, sy, sz) = mw.decompose()
 
         # Optionally, roughly match the mesh bounds with per-axis scale
         if props.match_box_bounds and obj.type == 'MESH':
-            dx, dy, dz = obj.dimensions  # world-space dims
+            dx, dy, dz = dims
             base_size = box_empty.empty_display_size  # side length = 2 * size * scale
             if base_size <= 0:
                 base_size = 1.0
@@ -269,7 +239,18 @@ class EDMTOOLS_OT_rig_clickable(bpy.types.Operator):
             sx = dx / (2.0 * base_size) if dx > 0 else 1.0
             sy = dy / (2.0 * base_size) if dy > 0 else 1.0
             sz = dz / (2.0 * base_size) if dz > 0 else 1.0
-            box_empty.scale = (sx, sy, sz)
+
+        # Pivot at the geometry center, written in one go
+        box_empty.matrix_world = (
+            Matrix.Translation(center_world)
+            @ rot.to_matrix().to_4x4()
+            @ Matrix.Diagonal((sx, sy, sz, 1.0))
+        )
+
+        # Apply rotation locks from UI selection
+        box_empty.lock_rotation[0] = props.lock_rot_x
+        box_empty.lock_rotation[1] = props.lock_rot_y
+        box_empty.lock_rotation[2] = props.lock_rot_z
 
         collection.objects.link(box_empty)
 
@@ -289,7 +270,8 @@ class EDMTOOLS_OT_rig_clickable(bpy.types.Operator):
         parent_keep_transform(box_empty, anim_empty, context)
 
         # ---------------- Selection feedback ----------------
-        bpy.ops.object.select_all(action='DESELECT')
+        for o in context.selected_objects:
+            o.select_set(False)
         anim_empty.select_set(True)
         box_empty.select_set(True)
         obj.select_set(True)
@@ -365,11 +347,11 @@ class EDMTOOLS_PT_rig_clickables_subpanel(bpy.types.Panel):
         header.label(text="Clickable Empty Settings:", icon='EMPTY_DATA')
     
         # Display effective/default connector name
-        default_preview = f"PNT-{props.arg_number}"
-        if props.box_name.strip():
-            col.label(text=f"Effective name: {props.box_name}")
+        box_name = props.box_name.strip()
+        if box_name:
+            col.label(text=f"Effective name: {box_name}")
         else:
-            col.label(text=f"Default name: {default_preview}")
+            col.label(text=f"Default name: PNT-{props.arg_number}")
     
         # Optional name override
         col.label(text="Default Name Override:")
@@ -425,15 +407,17 @@ _classes = (
     EDMTOOLS_PT_rig_clickables_subpanel,
 )
 
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(_classes)
+
 def register():
-    for c in _classes:
-        bpy.utils.register_class(c)
+    _register_classes()
     bpy.types.Scene.edm_tools_rig_clickables = PointerProperty(
         type=EDMToolsRigClickablesProps
     )
 
 def unregister():
-    for c in reversed(_classes):
-        bpy.utils.unregister_class(c)
-    if hasattr(bpy.types.Scene, "edm_tools_rig_clickables"):
+    _unregister_classes()
+    try:
         del bpy.types.Scene.edm_tools_rig_clickables
+    except AttributeError:
+        pass
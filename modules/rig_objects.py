@@ -327,11 +327,12 @@ _classes = (
     EDMTOOLS_PT_create_anim_empty,
 )
 
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(_classes)
+
 
 def register():
 
-    for c in _classes:
-        bpy.utils.register_class(c)
+    _register_classes()
 
     bpy.types.Scene.edm_tools_anim_empty = PointerProperty(
         type=EDMToolsAnimEmptyProps
@@ -340,8 +341,9 @@ def register():
 
 def unregister():
 
-    for c in reversed(_classes):
-        bpy.utils.unregister_class(c)
+    _unregister_classes()
 
-    if hasattr(bpy.types.Scene, "edm_tools_anim_empty"):
-        del bpy.types.Scene.edm_tools_anim_empty
\ No newline at end of file
+    try:
+        del bpy.types.Scene.edm_tools_anim_empty
+    except AttributeError:
+        pass
\ No newline at end of file